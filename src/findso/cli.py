@@ -1,20 +1,91 @@
 """Command line interface for the findso package."""
 
 import argparse
+import ctypes
 import logging
 import multiprocessing
+import os
 import time
-from typing import List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 
 from findso import __version__
-from findso.core import SymbolFinder, scan_so_files
-
-
-def process_chunk(args: tuple) -> List[str]:
-    """Process a chunk of files in a worker process."""
-    files, symbol, find_all, verbose = args
-    finder = SymbolFinder(files, verbose=verbose)
-    return finder.find_symbol(symbol, find_all=find_all)
+from findso.core import BinaryAnalysisCache, CacheEntry, SymbolFinder, _attach_handler, scan_so_files
+
+
+# Per-process finder set up once by _init_worker and reused for every chunk
+_WORKER_FINDER: Optional[SymbolFinder] = None
+
+
+def _init_worker(verbose: bool, shared_stop: ctypes.c_byte, use_cache: bool) -> None:
+    """Set up colorama, logging, the cache and the shared stop flag once per worker process."""
+    global _WORKER_FINDER
+    cache = BinaryAnalysisCache() if use_cache else None
+    _WORKER_FINDER = SymbolFinder([], verbose=verbose, shared_stop=shared_stop, cache=cache)
+
+
+def process_chunk(files: List[str], symbol: str, find_all: bool) -> Tuple[List[str], Dict[str, CacheEntry]]:
+    """Process a chunk of files in a worker process.
+
+    Returns the matching paths along with the cache entries the chunk added, so the parent
+    process stays the only one writing the cache to disk.
+    """
+    _WORKER_FINDER.so_files = files
+    found_paths = _WORKER_FINDER.find_symbol(symbol, find_all=find_all)
+    new_entries = _WORKER_FINDER.cache.drain() if _WORKER_FINDER.cache is not None else {}
+    return found_paths, new_entries
+
+
+def _available_cpus() -> int:
+    """Return the number of CPUs this process may run on, honoring its affinity mask."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _search_parallel(
+    so_files: List[str], args: argparse.Namespace, cache: Optional[BinaryAnalysisCache], logger: logging.Logger
+) -> List[str]:
+    """Search so_files on args.jobs worker processes, merging their new cache entries into cache."""
+    # Many small chunks pulled on demand let fast workers take over the tail from a worker
+    # stuck on a huge library, instead of a few large chunks that may bundle several.
+    # Only as many workers as there are CPUs in our affinity mask run at once, so size
+    # the chunks for those rather than for the requested job count.
+    workers = min(args.jobs, _available_cpus())
+    chunk_size = max(1, len(so_files) // (workers * 16))
+    chunks = [so_files[i : i + chunk_size] for i in range(0, len(so_files), chunk_size)]
+
+    logger.debug("Processing %d chunks with %d processes", len(chunks), args.jobs)
+
+    # Process chunks in parallel; results arrive in completion order so the first
+    # match surfaces as soon as any worker finds it. The stop flag is a byte of shared
+    # memory, so polling it is a plain load rather than a round trip to a manager process.
+    stop_flag = multiprocessing.RawValue(ctypes.c_byte, 0)
+    process_start = time.time()
+    # Matches are kept per chunk and joined in chunk order, so --all prints them in the same
+    # order as a single-process run no matter which worker finishes first
+    chunk_results: List[List[str]] = [[] for _ in chunks]
+
+    with ProcessPoolExecutor(
+        max_workers=args.jobs, initializer=_init_worker, initargs=(args.verbose, stop_flag, cache is not None)
+    ) as executor:
+        futures = {executor.submit(process_chunk, chunk, args.symbol, args.all): i for i, chunk in enumerate(chunks)}
+        for future in as_completed(futures):
+            chunk_result, new_entries = future.result()
+            if cache is not None:
+                cache.update(new_entries)
+            if chunk_result:
+                chunk_results[futures[future]] = chunk_result
+                if not args.all:
+                    # Tell in-flight workers to bail out and drop the queued chunks
+                    stop_flag.value = 1
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+    process_time = time.time() - process_start
+    logger.debug("Processed chunks in %.2f seconds", process_time)
+    return [path for chunk_result in chunk_results for path in chunk_result]
 
 
 def main():
@@ -34,6 +105,8 @@ def main():
                 "findso /usr/lib/x86_64-linux-gnu/ puts --all --verbose",
                 "# Use multiple jobs",
                 "findso /usr/lib/x86_64-linux-gnu/ puts --jobs 4",
+                "# Cache exported functions for repeated lookups in the same directory",
+                "findso /usr/lib/x86_64-linux-gnu/ puts --cache",
             ]
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -49,6 +122,11 @@ def main():
         default=1,
         help="Number of parallel jobs to use (default: 1)",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Keep an index of exported functions in ~/.cache/findso to speed up repeated lookups",
+    )
     args = parser.parse_args()
 
     start_time = time.time()
@@ -56,11 +134,7 @@ def main():
     # Set up logging
     logger = logging.getLogger("findso")
     logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(processName)s] :: %(message)s")
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    _attach_handler(logger)
 
     # Log the initial search message
     logger.info("Looking up %s", args.symbol)
@@ -75,50 +149,25 @@ def main():
         logger.warning("No .so files found in %s", args.so_dir)
         return
 
+    cache = BinaryAnalysisCache() if args.cache else None
+
     # Process files in parallel if requested
     if args.jobs > 1:
-        # Split files into chunks for parallel processing
-        # Use smaller chunks for better load balancing
-        chunk_size = max(1, min(50, len(so_files) // (args.jobs * 2)))
-        chunks = [so_files[i : i + chunk_size] for i in range(0, len(so_files), chunk_size)]
-
-        logger.debug("Processing %d chunks with %d processes", len(chunks), args.jobs)
-
-        # Process chunks in parallel
-        with multiprocessing.Pool(processes=args.jobs) as pool:
-            process_start = time.time()
-            found_paths = []
-
-            # Submit all chunks and collect results
-            results = []
-            for chunk in chunks:
-                result = pool.apply_async(process_chunk, ((chunk, args.symbol, args.all, args.verbose),))
-                results.append(result)
-
-            # Collect results as they complete
-            for result in results:
-                chunk_result = result.get()
-                if chunk_result:
-                    found_paths.extend(chunk_result)
-                    if not args.all and found_paths:
-                        # Terminate the pool to stop remaining tasks
-                        pool.terminate()
-                        break
-
-            # Wait for remaining processes
-            pool.close()
-            pool.join()
-
-            process_time = time.time() - process_start
-            logger.debug("Processed chunks in %.2f seconds", process_time)
+        found_paths = _search_parallel(so_files, args, cache, logger)
     else:
         # Single-process processing
         process_start = time.time()
-        finder = SymbolFinder(so_files, verbose=args.verbose)
+        finder = SymbolFinder(so_files, verbose=args.verbose, cache=cache)
         found_paths = finder.find_symbol(args.symbol, find_all=args.all)
         process_time = time.time() - process_start
         logger.debug("Processed files in %.2f seconds", process_time)
 
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            logger.warning("Could not write symbol cache to %s: %s", cache.cache_dir, e)
+
     total_time = time.time() - start_time
     logger.debug("Total execution time: %.2f seconds", total_time)
 
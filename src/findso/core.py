@@ -1,120 +1,678 @@
 """Core functionality for finding symbols in shared object files."""
 
+import array
+import concurrent.futures
+import contextlib
+import ctypes
+import functools
+import hashlib
 import logging
+import mmap
 import multiprocessing
-import subprocess
+import os
+import pickle
+import queue
+import struct
+import sys
+import tempfile
+import threading
 import typing
 from posixpath import basename
 
 from colorama import Fore, init
 from elftools.common.exceptions import ELFError
-from elftools.elf.dynamic import DynamicSection
 from elftools.elf.elffile import ELFFile
 
+ELF_MAGIC = b"\x7fELF"
+
+# Raw ELF64 little-endian layouts, used by the fast path in _scan_dynsym. The Struct objects
+# are compiled once here and their bound unpack_from methods looked up once.
+_ELFCLASS64 = 2
+_ELFDATA2LSB = 1
+_EHDR_UNPACK = struct.Struct("<16sHHIQQQIHHHHHH").unpack_from
+_SHDR_STRUCT = struct.Struct("<IIQQQQIIQQ")
+_SHDR_UNPACK = _SHDR_STRUCT.unpack_from
+_SHDR_SIZE = _SHDR_STRUCT.size
+_SYM_STRUCT = struct.Struct("<IBBHQQ")
+_SYM_UNPACK = _SYM_STRUCT.unpack_from
+_SYM_ITER_UNPACK = _SYM_STRUCT.iter_unpack
+_SYM_SIZE = _SYM_STRUCT.size
+_SHN_UNDEF = 0
+_STT_FUNC = 2
+
+# Readahead for the files find_symbol is about to parse. The ELF header, .dynsym and .dynstr
+# sit near the start of a shared object and the section header table at its end, so only
+# those two windows are requested rather than the whole (possibly huge) file.
+_READAHEAD_PAGE = 4096
+_READAHEAD_HEAD = 1 << 20
+_READAHEAD_TAIL = 64 << 10
+
+# find_symbol's I/O threads and how many opened files may wait for the parser
+_IO_THREADS = 4
+_IO_QUEUE_SIZE = 32
+
+
+def _scan_dir(
+    dirpath: str, logger: logging.Logger
+) -> typing.Tuple[typing.List[str], typing.List[typing.Tuple[str, typing.Tuple[int, int]]]]:
+    """List one directory, returning its subdirectories and the ELF .so files it holds.
+
+    Each file comes with its (st_dev, st_ino) so hard links can be told apart from distinct
+    libraries. Entries of a directory other than subdirectories live on the directory's own
+    device, so its st_dev plus DirEntry.inode() identifies them without a stat each.
+    """
+    subdirs = []
+    elf_files = []
+    st_dev = os.stat(dirpath).st_dev
+    with os.scandir(dirpath) as it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                subdirs.append(e.path)
+            elif ".so" in e.name and e.is_file(follow_symlinks=False):
+                try:
+                    with open(e.path, "rb") as fh:
+                        head = fh.read(4)
+                    if head == ELF_MAGIC:
+                        elf_files.append((e.path, (st_dev, e.inode())))
+                except OSError as err:
+                    logger.warning("%sError checking file %s: %s%s", Fore.YELLOW, e.path, str(err), Fore.RESET)
+    return subdirs, elf_files
+
 
 def scan_so_files(so_dir: str, logger: logging.Logger) -> typing.List[str]:
-    """Scan directory for .so files and return list of valid ELF files."""
+    """Scan directory for .so files and return list of valid ELF files, one path per inode."""
+    if not os.path.isdir(so_dir):
+        logger.warning("%sDirectory %s not found or not accessible%s", Fore.YELLOW, so_dir, Fore.RESET)
+        return []
+
+    # Directories are fanned out to a thread pool; scandir releases the GIL while in getdents
+    elf_files = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        root = pool.submit(_scan_dir, so_dir, logger)
+        pending = {root}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                try:
+                    subdirs, found = future.result()
+                except OSError as e:
+                    if future is root:
+                        logger.error("%sError scanning directory: %s%s", Fore.RED, str(e), Fore.RESET)
+                        return []
+                    continue  # skip unreadable subdirectories
+                elf_files.extend(found)
+                pending.update(pool.submit(_scan_dir, d, logger) for d in subdirs)
+    # Directories complete in whatever order the threads finish them; sort for stable output,
+    # which also makes the lexicographically smallest path the one kept for each inode
+    so_files = []
+    seen = set()
+    for path, key in sorted(elf_files):
+        if key not in seen:
+            seen.add(key)
+            so_files.append(path)
+    return so_files
+
+
+def _readahead(fd: int) -> None:
+    """Ask the kernel to start reading the parts of an ELF file _scan_dynsym touches."""
+    size = os.fstat(fd).st_size
+    os.posix_fadvise(fd, 0, min(size, _READAHEAD_HEAD), os.POSIX_FADV_WILLNEED)
+    if size > _READAHEAD_HEAD:
+        tail = max(_READAHEAD_HEAD, size - _READAHEAD_TAIL)
+        os.posix_fadvise(fd, tail, size - tail, os.POSIX_FADV_WILLNEED)
+
+
+def _open_readahead(path: str) -> typing.Optional[int]:
+    """Open path, request readahead and pull in its first page.
+
+    Returns the fd, or None if the file could not be opened. Meant to run on an I/O thread:
+    the blocking pread happens there, with the GIL released, instead of in the parser.
+    """
     try:
-        # Find all .so* files
-        result = subprocess.run(
-            ["find", so_dir, "-name", "*.so*"],
-            capture_output=True,
-            text=True,
-            check=False,  # Don't raise on non-zero exit
-        )
-        if result.returncode != 0:
-            logger.warning("%sDirectory %s not found or not accessible%s", Fore.YELLOW, so_dir, Fore.RESET)
-            return []
-
-        sofiles = result.stdout.splitlines()
-        if not sofiles:
-            return []
-
-        # Filter to ELF files only
-        elf_files = []
-        for path in sofiles:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None  # the parser reopens it and reports the error
+    try:
+        if hasattr(os, "posix_fadvise"):
+            _readahead(fd)
+        os.pread(fd, _READAHEAD_PAGE, 0)
+    except OSError:
+        pass
+    return fd
+
+
+class _ReorderBuffer:
+    """Consumer-side state of _FileLoader: files that arrived ahead of their turn."""
+
+    def __init__(self, producers: int):
+        self.producers = producers
+        self._items: typing.Dict[int, typing.Tuple[str, typing.Optional[int]]] = {}
+        self._next_index = 0
+
+    def receive(self, item: typing.Optional[typing.Tuple[int, str, typing.Optional[int]]]) -> None:
+        """Store an (index, path, fd) item from a producer; None means that producer exited."""
+        if item is None:
+            self.producers -= 1
+        else:
+            index, path, fd = item
+            self._items[index] = (path, fd)
+
+    def pop_next(self) -> typing.Optional[typing.Tuple[str, typing.Optional[int]]]:
+        """Return the (path, fd) pair whose turn it is, or None if it has not arrived yet."""
+        item = self._items.pop(self._next_index, None)
+        if item is not None:
+            self._next_index += 1
+        return item
+
+    def clear(self) -> typing.List[typing.Tuple[str, typing.Optional[int]]]:
+        """Forget and return every buffered pair."""
+        items = list(self._items.values())
+        self._items.clear()
+        return items
+
+
+class _FileLoader:
+    """Opens files on a pool of I/O threads and yields (path, fd) pairs in input order.
+
+    At most ``maxsize`` files are open and not yet consumed at any time, which keeps the I/O
+    threads a bounded distance ahead of the parser. Files finishing out of order wait in a
+    reorder buffer until their turn. The fd is None for files that could not be opened. Every
+    fd yielded belongs to the caller, who must close it; close() stops the threads and closes
+    whatever was not yet consumed.
+    """
+
+    def __init__(self, paths: typing.Iterable[str], num_threads: int = _IO_THREADS, maxsize: int = _IO_QUEUE_SIZE):
+        self._paths = enumerate(paths)
+        self._paths_lock = threading.Lock()
+        self._slots = threading.Semaphore(maxsize)
+        self._queue: queue.Queue = queue.Queue()
+        self._buffer = _ReorderBuffer(num_threads)
+        self._stopped = threading.Event()
+        self._threads = [threading.Thread(target=self._run, daemon=True) for _ in range(num_threads)]
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                # The consumer releases the slot once it takes the file, so no with-block here
+                self._slots.acquire()  # pylint: disable=consider-using-with
+                if self._stopped.is_set():
+                    break
+                # Paths are handed out in index order, so the next one the consumer waits
+                # for is always among those in flight
+                with self._paths_lock:
+                    item = next(self._paths, None)
+                if item is None:
+                    break
+                index, path = item
+                self._queue.put((index, path, _open_readahead(path)))
+        finally:
+            self._queue.put(None)
+
+    def __iter__(self) -> typing.Iterator[typing.Tuple[str, typing.Optional[int]]]:
+        while True:
+            item = self._buffer.pop_next()
+            if item is not None:
+                self._slots.release()
+                yield item
+            elif self._buffer.producers:
+                self._buffer.receive(self._queue.get())
+            else:
+                return
+
+    def close(self) -> None:
+        """Stop the I/O threads and close the fds nobody consumed."""
+        self._stopped.set()
+        # Wake producers waiting for a slot so they can notice the stop
+        for _ in self._threads:
+            self._slots.release()
+        while self._buffer.producers:
+            self._buffer.receive(self._queue.get())
+        for thread in self._threads:
+            thread.join()
+        for _, fd in self._buffer.clear():
+            if fd is not None:
+                os.close(fd)
+
+    def __enter__(self) -> "_FileLoader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@contextlib.contextmanager
+def _map_file(path: str, fd: typing.Optional[int] = None) -> typing.Iterator[mmap.mmap]:
+    """Map path read-only, reusing fd when the caller already has it open."""
+    if fd is not None:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield mm
+
+
+def _cstr(buf, offset: int) -> bytes:
+    """Return the NUL-terminated string starting at offset in buf."""
+    end = buf.find(b"\0", offset)
+    if end < 0:
+        raise ValueError("unterminated string")
+    return buf[offset:end]
+
+
+def _locate_dynsym(mm: mmap.mmap) -> typing.Optional[typing.Tuple[int, int, int, int]]:
+    """Return (sym_off, sym_size, str_off, str_size) for .dynsym and its string table, or None.
+
+    Raises ValueError (or struct.error) for layouts other than ELF64 LSB so callers can
+    fall back to pyelftools.
+    """
+    ident, _, _, _, _, _, e_shoff, _, _, _, _, e_shentsize, e_shnum, e_shstrndx = _EHDR_UNPACK(mm, 0)
+    if ident[:4] != ELF_MAGIC or ident[4] != _ELFCLASS64 or ident[5] != _ELFDATA2LSB:
+        raise ValueError("not an ELF64 little-endian file")
+    if e_shentsize != _SHDR_SIZE or e_shnum == 0 or e_shstrndx >= e_shnum:
+        raise ValueError("unsupported section header table")
+
+    sections = [_SHDR_UNPACK(mm, e_shoff + i * _SHDR_SIZE) for i in range(e_shnum)]
+    shstrtab_off = sections[e_shstrndx][4]
+    by_name = {_cstr(mm, shstrtab_off + sh[0]): sh for sh in sections}
+
+    dynsym = by_name.get(b".dynsym")
+    if dynsym is None or dynsym[6] >= e_shnum:
+        return None
+    # .dynsym's sh_link names its string table (.dynstr)
+    dynstr = sections[dynsym[6]]
+    return dynsym[4], dynsym[5], dynstr[4], dynstr[5]
+
+
+def _iter_function_names(mm: mmap.mmap, sym_off: int, sym_size: int, str_off: int) -> typing.Iterator[bytes]:
+    """Yield the names of the defined function symbols in a raw Elf64_Sym table."""
+    for st_name, st_info, _, st_shndx, st_value, _ in _SYM_ITER_UNPACK(
+        mm[sym_off : sym_off + sym_size - sym_size % _SYM_SIZE]
+    ):
+        if st_shndx == _SHN_UNDEF or (st_info & 0xF) != _STT_FUNC or st_value == 0:
+            continue
+        yield _cstr(mm, str_off + st_name)
+
+
+def _st_name_column(mm: mmap.mmap, sym_off: int, sym_end: int) -> array.array:
+    """Return the st_name field of every Elf64_Sym record as an array, extracted in C."""
+    words = array.array("I", mm[sym_off:sym_end])
+    if sys.byteorder != "little":
+        words.byteswap()
+    # st_name is the first 4-byte word of each record
+    return words[:: _SYM_SIZE // words.itemsize]
+
+
+def _has_function_named(mm: mmap.mmap, sym_off: int, st_names: array.array, name_offsets: typing.Set[int]) -> bool:
+    """Check whether a defined function symbol has its st_name in name_offsets."""
+    # The set intersection rejects almost every record in C; only real name matches get unpacked
+    for st_name in name_offsets.intersection(st_names):
+        idx = st_names.index(st_name)
+        while True:
+            _, st_info, _, st_shndx, st_value, _ = _SYM_UNPACK(mm, sym_off + idx * _SYM_SIZE)
+            if st_shndx != _SHN_UNDEF and (st_info & 0xF) == _STT_FUNC and st_value != 0:
+                return True
             try:
-                result = subprocess.run(["file", path], capture_output=True, text=True, check=False)
-                if "ELF" in result.stdout:
-                    elf_files.append(path)
-            except (subprocess.SubprocessError, IOError) as e:
-                logger.warning("%sError checking file %s: %s%s", Fore.YELLOW, path, str(e), Fore.RESET)
-                continue
-        return elf_files
-    except (subprocess.SubprocessError, IOError, PermissionError) as e:
-        logger.error("%sError scanning directory: %s%s", Fore.RED, str(e), Fore.RESET)
-        return []
+                idx = st_names.index(st_name, idx + 1)
+            except ValueError:
+                break
+    return False
+
+
+def _scan_dynsym(path: str, target: bytes, fd: typing.Optional[int] = None) -> bool:
+    """Check whether the ELF64 LSB file at path exports target as a defined function.
+
+    Reads .dynsym and .dynstr straight out of an mmap instead of going through pyelftools.
+    The name is located in .dynstr with mmap.find and matched against the st_name column
+    with set operations, so no per-symbol work happens in Python.
+    """
+    with _map_file(path, fd) as mm:
+        located = _locate_dynsym(mm)
+        if located is None:
+            return False
+        sym_off, sym_size, str_off, str_size = located
+
+        # Most files don't have the symbol at all; one memmem over .dynstr rules that out
+        # before touching .dynsym. The needle has no leading NUL because the linker
+        # tail-merges strings (e.g. "puts" lives inside "_IO_puts"), and a symbol is called
+        # target iff its st_name is one of the offsets found here.
+        needle = target + b"\0"
+        str_end = str_off + str_size
+        name_offsets = set()
+        pos = mm.find(needle, str_off, str_end)
+        while pos >= 0:
+            name_offsets.add(pos - str_off)
+            pos = mm.find(needle, pos + 1, str_end)
+        if not name_offsets:
+            return False
+
+        sym_end = sym_off + sym_size - sym_size % _SYM_SIZE
+        return _has_function_named(mm, sym_off, _st_name_column(mm, sym_off, sym_end), name_offsets)
+
+
+def _exported_function_names(path: str, fd: typing.Optional[int] = None) -> typing.FrozenSet[bytes]:
+    """Return the raw names of all defined functions exported by the ELF64 LSB file at path."""
+    with _map_file(path, fd) as mm:
+        located = _locate_dynsym(mm)
+        if located is None:
+            return frozenset()
+        sym_off, sym_size, str_off, _ = located
+        return frozenset(_iter_function_names(mm, sym_off, sym_size, str_off))
+
+
+class BloomFilter:
+    """Bloom filter over the raw symbol names of one file.
+
+    Sized at BITS_PER_NAME bits per name with NUM_HASHES probes, for roughly a 1% false
+    positive rate whatever the number of names. Probes are derived by double hashing from
+    one 128-bit blake2b digest, so a query name is hashed once and reused for every filter.
+    """
+
+    BITS_PER_NAME = 10
+    NUM_HASHES = 7
+
+    def __init__(self, names: typing.Collection[bytes] = ()):
+        """Initialize a filter sized for names and add every one of them."""
+        self.num_bits = max(64, -(-len(names) * self.BITS_PER_NAME // 8) * 8)
+        self.bits = bytearray(self.num_bits // 8)
+        for name in names:
+            self.add(self.hashes(name))
+
+    @staticmethod
+    def hashes(name: bytes) -> typing.Tuple[int, int]:
+        """Return the pair of 64-bit hashes the probe positions for name are derived from."""
+        digest = hashlib.blake2b(name, digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def add(self, hashes: typing.Tuple[int, int]) -> None:
+        """Add the name that produced hashes to the filter."""
+        h1, h2 = hashes
+        for i in range(self.NUM_HASHES):
+            pos = (h1 + i * h2) % self.num_bits
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def might_contain(self, hashes: typing.Tuple[int, int]) -> bool:
+        """Return False if the name that produced hashes is definitely absent."""
+        h1, h2 = hashes
+        for i in range(self.NUM_HASHES):
+            pos = (h1 + i * h2) % self.num_bits
+            if not self.bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+
+class CacheEntry(typing.NamedTuple):
+    """Bloom filter of one file's exported functions, valid while its size and mtime match."""
+
+    size: int
+    mtime_ns: int
+    bloom: BloomFilter
+
+
+class BinaryAnalysisCache:
+    """Persistent index of the functions exported by each .so file.
+
+    Each file is summarized by a Bloom filter of its exported function names, about 10 bits per
+    name, rather than the names themselves: a negative rejects the file outright, and a positive
+    is confirmed by scanning that one file, which is cheaper than loading a stored name set.
+
+    Entries are keyed by absolute path and only trusted while the file's (st_size, st_mtime_ns)
+    still match, so rebuilt libraries are re-indexed automatically. Entries are sharded into one
+    pickle per library directory under ``cache_dir``; the format version is part of the shard
+    file name so a format change simply starts from an empty cache.
+    """
+
+    FORMAT_VERSION = 3
+
+    def __init__(self, cache_dir: typing.Optional[str] = None):
+        """Initialize the cache, defaulting to ``$XDG_CACHE_HOME/findso`` (``~/.cache/findso``)."""
+        if cache_dir is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+            cache_dir = os.path.join(cache_home, "findso")
+        self.cache_dir = cache_dir
+        self._shards: typing.Dict[str, typing.Dict[str, CacheEntry]] = {}
+        self._dirty: typing.Set[str] = set()
+        self._new_entries: typing.Dict[str, CacheEntry] = {}
+
+    def get_entry(self, path: str) -> typing.Optional[CacheEntry]:
+        """Return the cache entry for path, or None if missing or stale."""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        entry = self._shard(path).get(path)
+        if entry is None or entry.size != st.st_size or entry.mtime_ns != st.st_mtime_ns:
+            return None
+        return entry
+
+    def put(self, path: str, names: typing.Collection[bytes]) -> CacheEntry:
+        """Index the raw function names exported by path and return the new entry."""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        entry = CacheEntry(st.st_size, st.st_mtime_ns, BloomFilter(names))
+        self._store(path, entry)
+        self._new_entries[path] = entry
+        return entry
+
+    def drain(self) -> typing.Dict[str, CacheEntry]:
+        """Return and forget the entries added since the last drain, for handing to another process."""
+        entries, self._new_entries = self._new_entries, {}
+        return entries
+
+    def update(self, entries: typing.Dict[str, CacheEntry]) -> None:
+        """Merge entries drained from another cache instance."""
+        for path, entry in entries.items():
+            self._store(path, entry)
+
+    def save(self) -> None:
+        """Write modified shards back to disk atomically."""
+        if not self._dirty:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for key in self._dirty:
+            shard_path = self._shard_path(key)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    pickle.dump(self._shards[key], fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, shard_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        self._dirty.clear()
+
+    def _store(self, path: str, entry: CacheEntry) -> None:
+        self._shard(path)[path] = entry
+        self._dirty.add(self._shard_key(path))
+
+    @staticmethod
+    def _shard_key(path: str) -> str:
+        return hashlib.sha1(os.path.dirname(path).encode("utf-8", "surrogateescape")).hexdigest()[:16]
+
+    def _shard_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.v{self.FORMAT_VERSION}.pickle")
+
+    def _shard(self, path: str) -> typing.Dict[str, CacheEntry]:
+        key = self._shard_key(path)
+        shard = self._shards.get(key)
+        if shard is None:
+            try:
+                with open(self._shard_path(key), "rb") as fh:
+                    shard = pickle.load(fh)
+            except FileNotFoundError:
+                shard = {}
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+                shard = {}  # unreadable or corrupt shard, rebuild it
+            self._shards[key] = shard
+        return shard
+
+
+_COLORAMA_READY = False
+
+
+def _init_colorama() -> None:
+    """Initialize colorama once per process."""
+    global _COLORAMA_READY
+    if not _COLORAMA_READY:
+        init()
+        _COLORAMA_READY = True
+
+
+def _attach_handler(logger: logging.Logger) -> None:
+    """Give logger a stderr handler with the findso format, unless it already has one."""
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(processName)s] :: %(message)s")
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+
+@functools.lru_cache(maxsize=1)
+def _setup_logger() -> logging.Logger:
+    """Return the SymbolFinder logger, attaching its handler once per process."""
+    logger = logging.getLogger("SymbolFinder")
+    _attach_handler(logger)
+    return logger
 
 
 class SymbolFinder:
     """A class to find exported symbols in shared object files."""
 
-    def __init__(self, so_files: typing.List[str], verbose: bool = False, stop_flag: int = 0):
-        """Initialize SymbolFinder with a list of .so files to search."""
-        init()  # Initialize colorama
-        self.logger = logging.getLogger(__class__.__name__)
+    def __init__(
+        self,
+        so_files: typing.List[str],
+        verbose: bool = False,
+        stop_flag: int = 0,
+        shared_stop: typing.Optional[ctypes.c_byte] = None,
+        cache: typing.Optional[BinaryAnalysisCache] = None,
+    ):
+        """Initialize SymbolFinder with a list of .so files to search.
+
+        ``shared_stop`` is a byte in shared memory (``multiprocessing.RawValue``) through which
+        the worker that finds a match cooperatively stops the others. When ``cache`` is given,
+        files its Bloom filters rule out are skipped and files it has not seen are indexed;
+        saving it is left to the caller.
+        """
+        _init_colorama()
+        self.logger = _setup_logger()
         self.logger.setLevel(logging.INFO if verbose else logging.WARNING)
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(processName)s] :: %(message)s")
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
         self.so_files = so_files
         self.stop_flag = stop_flag
+        self.shared_stop = shared_stop
+        self.cache = cache
         self._log_lock = multiprocessing.Lock()
 
     def find_symbol(self, target_symbol: str, find_all: bool = False) -> typing.List[str]:
         """Search for a symbol in .so files, optionally finding all occurrences."""
         found_paths = []
+        target_bytes = target_symbol.encode()
 
-        for path in self.so_files:
-            # Check if we should stop
-            if self.stop_flag:
-                break
+        paths, entries = self._files_to_parse(target_symbol, BloomFilter.hashes(target_bytes))
+
+        # I/O threads open files and pull in their first pages while this thread parses,
+        # so cold-cache reads overlap with parsing instead of faulting in one file at a time
+        with _FileLoader(paths) as loader:
+            for path, fd in loader:
+                # Check if we should stop
+                if self._should_stop():
+                    if fd is not None:
+                        os.close(fd)
+                    break
+
+                try:
+                    found = self._lookup(path, target_symbol, target_bytes, fd, entries.get(path))
+                except (ELFError, IOError) as e:
+                    with self._log_lock:
+                        self._error("Error processing %s: %s", path, str(e))
+                    continue  # skip malformed files
+                finally:
+                    if fd is not None:
+                        os.close(fd)
+
+                if not found:
+                    # The common case; logging is thread-safe on its own, so skip the lock here
+                    self._info("No %s in %s", target_symbol, basename(path))
+                    continue
 
-            try:
-                with open(path, "rb") as f:
-                    elffile = ELFFile(f)
-                    # Find the dynamic section
-                    dynamic_section = None
-                    for section in elffile.iter_sections():
-                        if isinstance(section, DynamicSection):
-                            dynamic_section = section
-                            break
-                    if not dynamic_section:
-                        continue  # No dynamic section, skip
-                    # Now get the dynamic symbol table
-                    dynsym = elffile.get_section_by_name(".dynsym")
-                    if not dynsym:
-                        continue
-
-                    for symbol in dynsym.iter_symbols():
-                        # Check if we should stop
-                        if self.stop_flag:
-                            break
-
-                        is_defined = symbol["st_shndx"] != "SHN_UNDEF"
-                        is_function = symbol["st_info"]["type"] == "STT_FUNC"
-                        has_addr = symbol["st_value"] != 0
-                        if symbol.name == target_symbol and is_defined and is_function and has_addr:
-                            with self._log_lock:
-                                self._success("Found %s in %s", target_symbol, path)
-                            found_paths.append(path)
-                            if not find_all:
-                                self.stop_flag = 1
-                                return found_paths
-                            break
-
-                    if not found_paths:
-                        with self._log_lock:
-                            self._info("No %s in %s", target_symbol, basename(path))
-            except (ELFError, IOError) as e:
                 with self._log_lock:
-                    self._error("Error processing %s: %s", path, str(e))
-                continue  # skip malformed files
+                    self._success("Found %s in %s", target_symbol, path)
+                found_paths.append(path)
+                if not find_all:
+                    self.stop_flag = 1
+                    if self.shared_stop is not None:
+                        self.shared_stop.value = 1
+                    break
 
         return found_paths
 
+    def _files_to_parse(
+        self, target_symbol: str, target_hashes: typing.Tuple[int, int]
+    ) -> typing.Tuple[typing.List[str], typing.Dict[str, typing.Optional[CacheEntry]]]:
+        """Drop the files the cache rules out, so only the rest are opened and prefetched.
+
+        Returns the remaining paths in input order, along with the cache entry looked up for
+        each of them (None when the file is not indexed yet).
+        """
+        if self.cache is None:
+            return self.so_files, {}
+
+        paths = []
+        entries = {}
+        for path in self.so_files:
+            if self._should_stop():
+                break
+            try:
+                entry = self.cache.get_entry(path)
+            except OSError:
+                entry = None  # let the parse report it
+            if entry is not None and not entry.bloom.might_contain(target_hashes):
+                self._info("No %s in %s", target_symbol, basename(path))
+                continue
+            paths.append(path)
+            entries[path] = entry
+        return paths, entries
+
+    def _lookup(
+        self,
+        path: str,
+        target_symbol: str,
+        target_bytes: bytes,
+        fd: typing.Optional[int] = None,
+        entry: typing.Optional[CacheEntry] = None,
+    ) -> bool:
+        """Check a single file, indexing it first when a cache is configured and has no entry for it."""
+        try:
+            if self.cache is not None and entry is None:
+                names = _exported_function_names(path, fd)
+                self.cache.put(path, names)
+                return target_bytes in names
+            return _scan_dynsym(path, target_bytes, fd)
+        except (ValueError, struct.error):
+            # Not a layout the fast path understands, let pyelftools deal with it
+            return self._find_with_pyelftools(path, target_symbol)
+
+    def _find_with_pyelftools(self, path: str, target_symbol: str) -> bool:
+        """Slow path: look the symbol up through pyelftools."""
+        with open(path, "rb") as f:
+            elffile = ELFFile(f)
+            dynsym = elffile.get_section_by_name(".dynsym")
+            if dynsym is None:
+                return False
+
+            for symbol in dynsym.iter_symbols():
+                # Check if we should stop
+                if self._should_stop():
+                    break
+
+                is_defined = symbol["st_shndx"] != "SHN_UNDEF"
+                is_function = symbol["st_info"]["type"] == "STT_FUNC"
+                has_addr = symbol["st_value"] != 0
+                if symbol.name == target_symbol and is_defined and is_function and has_addr:
+                    return True
+        return False
+
+    def _should_stop(self) -> bool:
+        return bool(self.stop_flag) or (self.shared_stop is not None and bool(self.shared_stop.value))
+
     def _success(self, message: str, *args) -> None:
         formatted_message = message % args
         self.logger.info("%s%s%s", Fore.GREEN, formatted_message, Fore.RESET)
@@ -128,5 +686,4 @@ class SymbolFinder:
         self.logger.error("%s%s%s", Fore.RED, formatted_message, Fore.RESET)
 
     def _info(self, message: str, *args) -> None:
-        formatted_message = message % args
-        self.logger.info(formatted_message)
+        self.logger.info(message, *args)
@@ -1,9 +1,13 @@
 """Tests for the core SymbolFinder functionality."""
 
+import ctypes
+import multiprocessing
 import os
 import logging
+import threading
+import time
 
-from findso.core import SymbolFinder, scan_so_files
+from findso.core import BinaryAnalysisCache, BloomFilter, SymbolFinder, _FileLoader, _scan_dynsym, scan_so_files
 
 # Known test directory and symbol that exists in multiple files
 TEST_DIR = "/usr/lib/x86_64-linux-gnu/"
@@ -18,6 +22,13 @@ def test_symbol_finder_initialization():
     assert len(finder.so_files) > 0
 
 
+def test_scan_so_files_is_sorted():
+    """Test that the threaded scan returns the same, sorted list on every call."""
+    so_files = scan_so_files(TEST_DIR, logging.getLogger(__name__))
+    assert so_files == sorted(so_files)
+    assert scan_so_files(TEST_DIR, logging.getLogger(__name__)) == so_files
+
+
 def test_find_symbol_default_behavior():
     """Test finding first occurrence of a symbol."""
     so_files = scan_so_files(TEST_DIR, logging.getLogger(__name__))
@@ -41,6 +52,23 @@ def test_find_symbol_find_all():
         assert ".so" in path  # Check for .so anywhere in the path
 
 
+def test_find_symbol_honors_shared_stop():
+    """Test that a stop already raised by another worker ends the search before any match."""
+    so_files = scan_so_files(TEST_DIR, logging.getLogger(__name__))
+    shared_stop = multiprocessing.RawValue(ctypes.c_byte, 1)
+    finder = SymbolFinder(so_files, shared_stop=shared_stop)
+    assert finder.find_symbol(TEST_SYMBOL, find_all=True) == []
+
+
+def test_find_symbol_raises_shared_stop():
+    """Test that a first-match search tells the other workers to stop."""
+    so_files = scan_so_files(TEST_DIR, logging.getLogger(__name__))
+    shared_stop = multiprocessing.RawValue(ctypes.c_byte, 0)
+    finder = SymbolFinder(so_files, shared_stop=shared_stop)
+    assert len(finder.find_symbol(TEST_SYMBOL)) == 1
+    assert shared_stop.value == 1
+
+
 def test_find_nonexistent_symbol():
     """Test searching for a non-existent symbol."""
     so_files = scan_so_files(TEST_DIR, logging.getLogger(__name__))
@@ -79,3 +107,112 @@ def test_find_symbol_with_invalid_so_file(tmp_path):
     found_paths = finder.find_symbol(TEST_SYMBOL)
     assert isinstance(found_paths, list)
     assert len(found_paths) == 0
+
+
+def test_scan_dynsym_matches_pyelftools():
+    """Test that the raw .dynsym scanner agrees with the pyelftools slow path."""
+    so_files = scan_so_files(TEST_DIR, logging.getLogger(__name__))
+    finder = SymbolFinder(so_files)
+    for path in so_files[:25]:
+        for symbol in (TEST_SYMBOL, "malloc", "nonexistent_symbol_12345"):
+            assert _scan_dynsym(path, symbol.encode()) == finder._find_with_pyelftools(path, symbol)
+
+
+def test_binary_analysis_cache_roundtrip(tmp_path):
+    """Test that cached entries survive a save/load and are dropped once the file changes."""
+    lib = tmp_path / "libfake.so"
+    lib.write_bytes(b"\x7fELF")
+    cache = BinaryAnalysisCache(str(tmp_path / "cache"))
+    assert cache.get_entry(str(lib)) is None
+    cache.put(str(lib), frozenset({b"foo", b"bar"}))
+    cache.save()
+
+    reloaded = BinaryAnalysisCache(str(tmp_path / "cache"))
+    entry = reloaded.get_entry(str(lib))
+    assert entry is not None
+    assert entry.bloom.might_contain(BloomFilter.hashes(b"foo"))
+    assert entry.bloom.might_contain(BloomFilter.hashes(b"bar"))
+
+    lib.write_bytes(b"\x7fELF rebuilt")
+    assert reloaded.get_entry(str(lib)) is None
+
+
+def test_find_symbol_with_cache(tmp_path):
+    """Test that a warm cache gives the same answers as a fresh scan."""
+    so_files = scan_so_files(TEST_DIR, logging.getLogger(__name__))
+    expected = SymbolFinder(so_files).find_symbol(TEST_SYMBOL, find_all=True)
+
+    cache = BinaryAnalysisCache(str(tmp_path))
+    assert SymbolFinder(so_files, cache=cache).find_symbol(TEST_SYMBOL, find_all=True) == expected
+    cache.save()
+    warm = BinaryAnalysisCache(str(tmp_path))
+    assert SymbolFinder(so_files, cache=warm).find_symbol(TEST_SYMBOL, find_all=True) == expected
+
+
+def test_bloom_filter():
+    """Test that the Bloom filter never rejects added names and stays near 1% false positives."""
+    for count in (10, 3000, 40000):
+        names = [f"symbol_{i}".encode() for i in range(count)]
+        bloom = BloomFilter(names)
+        assert all(bloom.might_contain(BloomFilter.hashes(name)) for name in names)
+        misses = sum(bloom.might_contain(BloomFilter.hashes(f"absent_{i}".encode())) for i in range(2000))
+        assert misses < 60
+
+
+def test_scan_so_files_skips_hard_links(tmp_path):
+    """Test that hard links to the same library are only returned once."""
+    lib = tmp_path / "libfake.so.1.2.3"
+    lib.write_bytes(b"\x7fELF")
+    os.link(lib, tmp_path / "libfake.so.1")
+    (tmp_path / "libother.so").write_bytes(b"\x7fELF")
+
+    so_files = scan_so_files(str(tmp_path), logging.getLogger(__name__))
+    assert so_files == [str(tmp_path / "libfake.so.1"), str(tmp_path / "libother.so")]
+
+
+def _open_fd_count():
+    return len(os.listdir("/proc/self/fd"))
+
+
+def test_file_loader_preserves_order_and_reports_unopenable(tmp_path):
+    """Test that the loader yields paths in input order, with None for files it cannot open."""
+    paths = []
+    for i in range(50):
+        path = tmp_path / f"lib{i}.so"
+        path.write_bytes(b"\x7fELF")
+        paths.append(str(path))
+    paths.insert(10, str(tmp_path / "missing.so"))
+
+    with _FileLoader(paths, num_threads=4, maxsize=4) as loader:
+        seen = []
+        for path, fd in loader:
+            seen.append(path)
+            if path.endswith("missing.so"):
+                assert fd is None
+            else:
+                assert fd is not None
+                os.close(fd)
+    assert seen == paths
+
+
+def test_file_loader_early_close_releases_everything(tmp_path):
+    """Test that breaking out early closes queued fds and stops the I/O threads."""
+    paths = []
+    for i in range(200):
+        path = tmp_path / f"lib{i}.so"
+        path.write_bytes(b"\x7fELF")
+        paths.append(str(path))
+
+    fds_before = _open_fd_count()
+    threads_before = threading.active_count()
+    with _FileLoader(paths, num_threads=4, maxsize=8) as loader:
+        for _, fd in loader:
+            os.close(fd)
+            # Let the producers fill every slot and block waiting for more
+            deadline = time.monotonic() + 10
+            while _open_fd_count() < fds_before + 8:
+                assert time.monotonic() < deadline, "I/O threads never filled the window"
+                time.sleep(0.01)
+            break
+    assert _open_fd_count() == fds_before
+    assert threading.active_count() == threads_before